@@ -4,21 +4,16 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import os
 import re
 import shutil
 import sys
-import tempfile
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
-
-import yaml
-
-try:
-    from quick_validate import validate_skill
-except Exception:  # pragma: no cover
-    validate_skill = None
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, Mapping
 
 from skill_roots import (
     resolve_bundled_skills_root,
@@ -36,6 +31,18 @@ SOURCE_PRIORITIES = {
     "config_root": 4,
 }
 FRONTMATTER_RE = re.compile(r"^---\n([\s\S]*?)\n---\n?([\s\S]*)$")
+# Registry scans only need `name`; a lone, plain or simply-quoted top-level line
+# is read straight from the frontmatter bytes and anything fancier goes through
+# YAML. The rest of the block is not validated: frontmatter that YAML rejects
+# elsewhere still yields the matched name here instead of the directory name.
+_NAME_LINE_RE = re.compile(rb"^name: +(['\"]?)([A-Za-z0-9][\w.-]*)\1 *$", re.M)
+_NAME_KEY_RE = re.compile(rb"^name[ \t]*:", re.M)
+_YAML_PLAIN_KEYWORDS = frozenset(
+    {"y", "yes", "n", "no", "true", "false", "on", "off", "null"}
+)
+# Only this much of a SKILL.md is read for the name scan; a frontmatter block
+# that runs past it misses the fast path and is read in full.
+_FRONTMATTER_SCAN_BYTES = 4096
 SKILL_CARD_FIELDS = {
     "name",
     "description",
@@ -51,17 +58,45 @@ class SkillRoot:
     root_dir: Path
     skill_dir: Path
     source: str
+    # Derived from source so the two cannot drift; synthetic roots rank lowest.
+    priority: int = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "priority", SOURCE_PRIORITIES.get(self.source, 0))
 
 
 @dataclass(frozen=True)
 class SkillEntry:
     name: str
     category: str
+    # Both paths are resolved when the entry is built; compare them directly.
     file_path: Path
     base_dir: Path
     root: SkillRoot
 
 
+# yaml (and quick_validate, which imports it) load on first use so --help and
+# early errors skip the import; the name-only registry scan never needs it.
+_yaml_mod: Any = None
+
+
+def _yaml() -> Any:
+    global _yaml_mod
+    if _yaml_mod is None:
+        import yaml
+
+        _yaml_mod = yaml
+    return _yaml_mod
+
+
+def _load_validator() -> Callable[[Path], tuple[bool, str]] | None:
+    try:
+        from quick_validate import validate_skill
+    except Exception:  # pragma: no cover
+        return None
+    return validate_skill
+
+
 def resolve_maybe_absolute(path_text: str, base_dir: Path) -> Path:
     normalized = path_text.strip()
     if not normalized:
@@ -76,6 +111,7 @@ def resolve_maybe_absolute(path_text: str, base_dir: Path) -> Path:
     return (base_dir / candidate).resolve()
 
 
+@functools.lru_cache(maxsize=64)
 def has_v2_skill_directories(path: Path) -> bool:
     skills_root = path / "skills"
     return any((skills_root / category).is_dir() for category in VALID_CATEGORIES) or (
@@ -83,6 +119,7 @@ def has_v2_skill_directories(path: Path) -> bool:
     ).is_dir()
 
 
+@functools.lru_cache(maxsize=64)
 def resolve_skill_directory(root_dir: Path) -> Path | None:
     normalized = root_dir.resolve()
     if has_v2_skill_directories(normalized):
@@ -116,7 +153,7 @@ def append_discovered_root(
     existing_index = index_by_skill_dir.get(key)
     if existing_index is not None:
         existing = roots[existing_index]
-        if SOURCE_PRIORITIES[source] > SOURCE_PRIORITIES[existing.source]:
+        if SOURCE_PRIORITIES[source] > existing.priority:
             roots[existing_index] = SkillRoot(
                 root_dir=root_dir.resolve(),
                 skill_dir=existing.skill_dir,
@@ -186,34 +223,99 @@ def load_skill_settings(cwd: Path, config_path: str | None) -> tuple[list[Path],
     return configured_roots, disabled
 
 
-def parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
+def parse_frontmatter(content: str) -> tuple[Mapping[str, Any], str]:
+    # Results are shared across callers through the cache; copy before mutating.
+    return _parse_frontmatter_cached(content)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_frontmatter_cached(content: str) -> tuple[Mapping[str, Any], str]:
     match = FRONTMATTER_RE.match(content)
     if not match:
-        return {}, content
+        return MappingProxyType({}), content
     yaml_text = match.group(1) or ""
     body = match.group(2) or ""
+    yaml = _yaml()
     try:
         parsed = yaml.safe_load(yaml_text)
     except yaml.YAMLError:
         parsed = {}
-    return (parsed if isinstance(parsed, dict) else {}), body
+    return MappingProxyType(parsed if isinstance(parsed, dict) else {}), body
 
 
-def load_category_entries(category_dir: Path, category: str, root: SkillRoot) -> list[SkillEntry]:
-    if not category_dir.is_dir():
-        return []
-    out: list[SkillEntry] = []
-    for skill_md in sorted(category_dir.rglob("SKILL.md")):
-        raw = skill_md.read_text(encoding="utf8")
-        frontmatter, _ = parse_frontmatter(raw)
+def _fast_frontmatter_name(raw: bytes) -> str | None:
+    if not raw.startswith(b"---\n"):
+        return None
+    end = raw.find(b"\n---", 4)
+    if end < 0:
+        return None
+    match = _NAME_LINE_RE.search(raw, 4, end)
+    if not match:
+        return None
+    # YAML keeps the last duplicate key, and an indented next line continues
+    # a plain scalar; leave both to the full parser.
+    if _NAME_KEY_RE.search(raw, match.end(), end):
+        return None
+    if raw[match.end() + 1 : match.end() + 2] in (b" ", b"\t"):
+        return None
+    name = match.group(2).decode("ascii")
+    if not match.group(1) and (name.lower() in _YAML_PLAIN_KEYWORDS or name[0].isdigit()):
+        return None
+    return name
+
+
+def _read_frontmatter_head(path: Path) -> bytes:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, _FRONTMATTER_SCAN_BYTES)
+    finally:
+        os.close(fd)
+
+
+def _iter_skill_mds(root: str) -> Iterator[Path]:
+    # Nested SKILL.md files are skills too (the runtime walker registers them),
+    # so every subdirectory is visited, matching the old rglob traversal.
+    found: list[str] = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "SKILL.md" and entry.is_file():
+                        found.append(entry.path)
+        except OSError:
+            continue
+    # Compare by path parts, as sorted(Path) did, so "foo" still precedes
+    # "foo-v2" (last-wins precedence depends on it); splitting the raw strings
+    # once avoids rebuilding part tuples in every Path comparison.
+    found.sort(key=lambda path: path.split(os.sep))
+    for path in found:
+        yield Path(path)
+
+
+def read_skill_name(skill_md: Path) -> str:
+    name = _fast_frontmatter_name(_read_frontmatter_head(skill_md))
+    if name is None:
+        frontmatter, _ = parse_frontmatter(skill_md.read_text(encoding="utf8"))
         candidate_name = frontmatter.get("name")
         if isinstance(candidate_name, str) and candidate_name.strip():
             name = candidate_name.strip()
         else:
             name = skill_md.parent.name
+    return name
+
+
+def load_category_entries(category_dir: Path, category: str, root: SkillRoot) -> list[SkillEntry]:
+    # Callers pass directories from present_categories; a directory that has
+    # vanished since the listing is an OSError the walk already skips.
+    out: list[SkillEntry] = []
+    for skill_md in _iter_skill_mds(os.fspath(category_dir)):
         out.append(
             SkillEntry(
-                name=name,
+                name=read_skill_name(skill_md),
                 category=category,
                 file_path=skill_md.resolve(),
                 base_dir=skill_md.parent.resolve(),
@@ -223,10 +325,21 @@ def load_category_entries(category_dir: Path, category: str, root: SkillRoot) ->
     return out
 
 
+def present_categories(skill_dir: Path) -> list[str]:
+    # One listing of the root decides which categories to scan, instead of a
+    # stat per VALID_CATEGORIES entry that most roots do not carry.
+    try:
+        with os.scandir(skill_dir) as entries:
+            names = {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return []
+    return [category for category in VALID_CATEGORIES if category in names]
+
+
 def load_registry(roots: list[SkillRoot]) -> dict[str, SkillEntry]:
     loaded: dict[str, SkillEntry] = {}
     for root in roots:
-        for category in VALID_CATEGORIES:
+        for category in present_categories(root.skill_dir):
             for entry in load_category_entries(root.skill_dir / category, category, root):
                 loaded[entry.name] = entry
     return loaded
@@ -235,7 +348,7 @@ def load_registry(roots: list[SkillRoot]) -> dict[str, SkillEntry]:
 def load_registry_candidates(roots: list[SkillRoot]) -> dict[str, list[SkillEntry]]:
     loaded: dict[str, list[SkillEntry]] = {}
     for root in roots:
-        for category in VALID_CATEGORIES:
+        for category in present_categories(root.skill_dir):
             for entry in load_category_entries(root.skill_dir / category, category, root):
                 loaded.setdefault(entry.name, []).append(entry)
     return loaded
@@ -249,7 +362,7 @@ def choose_source_entry(candidates: list[SkillEntry], destination_dir: Path | No
 
     normalized_destination = destination_dir.resolve()
     for entry in reversed(candidates):
-        if entry.base_dir.resolve() != normalized_destination:
+        if entry.base_dir != normalized_destination:
             return entry
     return candidates[-1]
 
@@ -262,32 +375,36 @@ def resolve_explicit_source(source_path: str, cwd: Path) -> SkillEntry:
     raw = skill_md.read_text(encoding="utf8")
     frontmatter, _ = parse_frontmatter(raw)
     category = "domain"
+    skill_md_posix = skill_md.as_posix()
+    parent_category = skill_md.parent.parent.name
     for maybe_category in VALID_CATEGORIES:
-        if f"/skills/{maybe_category}/" in skill_md.as_posix() or skill_md.parent.parent.name == maybe_category:
+        if f"/skills/{maybe_category}/" in skill_md_posix or parent_category == maybe_category:
             category = maybe_category
             break
-    name = frontmatter.get("name") if isinstance(frontmatter.get("name"), str) else skill_md.parent.name
-    synthetic_root = SkillRoot(root_dir=skill_md.parent.parent.parent, skill_dir=skill_md.parent.parent, source="explicit")
+    # candidate is already resolved, so the directory holding SKILL.md is too.
+    base_dir = skill_md.parent
+    name = frontmatter.get("name") if isinstance(frontmatter.get("name"), str) else base_dir.name
+    synthetic_root = SkillRoot(root_dir=base_dir.parent.parent, skill_dir=base_dir.parent, source="explicit")
     return SkillEntry(
         name=name.strip(),
         category=category,
         file_path=skill_md.resolve(),
-        base_dir=skill_md.parent.resolve(),
+        base_dir=base_dir,
         root=synthetic_root,
     )
 
 
 def resolve_source_entry(
     cwd: Path, skill_name: str, source_path: str | None, config_path: str | None
-) -> tuple[SkillEntry, list[Path], list[str]]:
+) -> tuple[SkillEntry, list[SkillEntry], list[Path], list[str]]:
     configured_roots, disabled = load_skill_settings(cwd, config_path)
     if source_path:
-        return resolve_explicit_source(source_path, cwd), configured_roots, disabled
+        return resolve_explicit_source(source_path, cwd), [], configured_roots, disabled
     registry = load_registry_candidates(discover_skill_roots(cwd, configured_roots))
     candidates = registry.get(skill_name)
     if not candidates:
         raise RuntimeError(f"Skill '{skill_name}' was not found in discovered skill roots.")
-    return choose_source_entry(candidates), configured_roots, disabled
+    return choose_source_entry(candidates), candidates, configured_roots, disabled
 
 
 def category_relative_dir(category: str) -> Path:
@@ -331,6 +448,7 @@ def annotate_frontmatter(raw: str, entry: SkillEntry) -> str:
         if key in SKILL_CARD_FIELDS
     }
     skill_card["name"] = entry.name
+    yaml = _yaml()
     yaml_text = yaml.safe_dump(skill_card, sort_keys=False, allow_unicode=False).strip()
     provenance = (
         f"\n> Overlay forked from `{entry.file_path}` ({entry.category}). "
@@ -342,13 +460,26 @@ def annotate_frontmatter(raw: str, entry: SkillEntry) -> str:
     return f"---\n{yaml_text}\n---{body_text}"
 
 
+def _write_bytes(path: Path, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 def copy_skill(entry: SkillEntry, destination_dir: Path, force: bool) -> Path:
-    source_dir = entry.base_dir.resolve()
+    source_dir = entry.base_dir
     cleanup_dir: Path | None = None
     if destination_dir.exists():
         if not force:
             raise FileExistsError(f"Destination already exists: {destination_dir}")
         if source_dir == destination_dir.resolve():
+            # Self-forks are rare; keep tempfile off the common copy path.
+            import tempfile
+
             cleanup_dir = Path(tempfile.mkdtemp(prefix="brewva-skill-fork-self-"))
             source_dir = cleanup_dir / entry.base_dir.name
             shutil.copytree(entry.base_dir, source_dir)
@@ -357,7 +488,8 @@ def copy_skill(entry: SkillEntry, destination_dir: Path, force: bool) -> Path:
     shutil.copytree(source_dir, destination_dir)
     skill_md = destination_dir / "SKILL.md"
     raw = skill_md.read_text(encoding="utf8")
-    skill_md.write_text(annotate_frontmatter(raw, entry), encoding="utf8")
+    _write_bytes(skill_md, annotate_frontmatter(raw, entry).encode("utf8"))
+    validate_skill = _load_validator()
     if validate_skill is not None:
         valid, message = validate_skill(destination_dir)
         if not valid:
@@ -410,7 +542,7 @@ def main() -> int:
     args = parse_args()
     cwd = Path.cwd()
     skill_name = args.skill_name.strip()
-    entry, configured_roots, disabled = resolve_source_entry(
+    entry, candidates, configured_roots, disabled = resolve_source_entry(
         cwd=cwd,
         skill_name=skill_name,
         source_path=args.source,
@@ -421,11 +553,8 @@ def main() -> int:
     destination_parent = resolve_destination_parent(destination_root)
     destination_dir = destination_parent / entry.name
 
-    if not args.source:
-        registry = load_registry_candidates(discover_skill_roots(cwd, configured_roots))
-        candidates = registry.get(skill_name) or []
-        selected = choose_source_entry(candidates, destination_dir)
-        entry = selected
+    if candidates:
+        entry = choose_source_entry(candidates, destination_dir)
 
     destination_skill_md = copy_skill(entry, destination_dir, args.force)
 
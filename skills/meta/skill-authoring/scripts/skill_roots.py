@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 from pathlib import Path
 
@@ -49,7 +50,10 @@ def _has_git_root_marker(path: Path) -> bool:
     return (path / ".git").exists()
 
 
+@functools.lru_cache(maxsize=16)
 def resolve_workspace_root(cwd: Path) -> Path:
+    # Callers ask for the project root several times per run; walk the
+    # ancestors for the first marker only once per cwd.
     current = cwd.resolve()
     while True:
         if _has_brewva_config_root(current) or _has_git_root_marker(current):
@@ -27,6 +27,15 @@ function writeSkill(filePath: string, input: { name: string; description: string
   );
 }
 
+function writeRawSkill(filePath: string, nameLines: string[], description: string): void {
+  mkdirSync(dirname(filePath), { recursive: true });
+  writeFileSync(
+    filePath,
+    ["---", ...nameLines, `description: ${description}`, "---", "# raw skill", ""].join("\n"),
+    "utf8",
+  );
+}
+
 function runForkSkill(input: {
   scriptPath: string;
   cwd: string;
@@ -176,6 +185,127 @@ describe("skill-authoring fork script", () => {
     }
   });
 
+  test("forks a skill nested below another skill directory", () => {
+    const workspace = mkdtempSync(join(tmpdir(), "brewva-skill-fork-nested-skill-"));
+    const xdgRoot = mkdtempSync(join(tmpdir(), "brewva-skill-fork-nested-skill-xdg-"));
+
+    try {
+      mkdirSync(join(workspace, ".brewva"), { recursive: true });
+      writeSkill(join(xdgRoot, "brewva/skills/domain/outercraft/SKILL.md"), {
+        name: "outercraft",
+        description: "global outercraft",
+      });
+      writeSkill(join(xdgRoot, "brewva/skills/domain/outercraft/examples/inner/SKILL.md"), {
+        name: "innercraft",
+        description: "nested innercraft",
+      });
+
+      const result = runForkSkill({
+        scriptPath,
+        cwd: workspace,
+        args: ["innercraft"],
+        env: {
+          ...process.env,
+          XDG_CONFIG_HOME: xdgRoot,
+        },
+      });
+      assertSuccess(result);
+
+      const destination = join(workspace, ".brewva/skills/project/overlays/innercraft/SKILL.md");
+      expect(existsSync(destination)).toBe(true);
+      expect(readFileSync(destination, "utf8")).toContain("name: innercraft");
+    } finally {
+      rmSync(workspace, { recursive: true, force: true });
+      rmSync(xdgRoot, { recursive: true, force: true });
+    }
+  });
+
+  test("keeps path-part precedence for duplicate skill names in one category", () => {
+    const workspace = mkdtempSync(join(tmpdir(), "brewva-skill-fork-duplicate-"));
+    const xdgRoot = mkdtempSync(join(tmpdir(), "brewva-skill-fork-duplicate-xdg-"));
+
+    try {
+      mkdirSync(join(workspace, ".brewva"), { recursive: true });
+      writeSkill(join(xdgRoot, "brewva/skills/domain/dupcraft/SKILL.md"), {
+        name: "dupcraft",
+        description: "plain dupcraft",
+      });
+      writeSkill(join(xdgRoot, "brewva/skills/domain/dupcraft-v2/SKILL.md"), {
+        name: "dupcraft",
+        description: "suffixed dupcraft",
+      });
+
+      const result = runForkSkill({
+        scriptPath,
+        cwd: workspace,
+        args: ["dupcraft"],
+        env: {
+          ...process.env,
+          XDG_CONFIG_HOME: xdgRoot,
+        },
+      });
+      assertSuccess(result);
+      expect(result.stdout).toContain("/dupcraft-v2/SKILL.md");
+      const forked = readFileSync(
+        join(workspace, ".brewva/skills/project/overlays/dupcraft/SKILL.md"),
+        "utf8",
+      );
+      expect(forked).toContain("suffixed dupcraft");
+    } finally {
+      rmSync(workspace, { recursive: true, force: true });
+      rmSync(xdgRoot, { recursive: true, force: true });
+    }
+  });
+
+  test("resolves frontmatter names with YAML semantics", () => {
+    const workspace = mkdtempSync(join(tmpdir(), "brewva-skill-fork-names-"));
+    const xdgRoot = mkdtempSync(join(tmpdir(), "brewva-skill-fork-names-xdg-"));
+    const cases: Array<{ dir: string; nameLines: string[]; expected: string }> = [
+      { dir: "quotedyescraft", nameLines: ["name: 'yes'"], expected: "yes" },
+      { dir: "doublequotedcraft", nameLines: ['name: "dq-craft"'], expected: "dq-craft" },
+      { dir: "boolcraft", nameLines: ["name: No"], expected: "boolcraft" },
+      { dir: "nullcraft", nameLines: ["name: null"], expected: "nullcraft" },
+      { dir: "digitcraft", nameLines: ["name: 123"], expected: "digitcraft" },
+      { dir: "digitledcraft", nameLines: ["name: 1abc-craft"], expected: "1abc-craft" },
+      {
+        dir: "duplicatecraft",
+        nameLines: ["name: firstcraft", "name: lastcraft"],
+        expected: "lastcraft",
+      },
+    ];
+
+    try {
+      mkdirSync(join(workspace, ".brewva"), { recursive: true });
+      for (const entry of cases) {
+        writeRawSkill(
+          join(xdgRoot, `brewva/skills/domain/${entry.dir}/SKILL.md`),
+          entry.nameLines,
+          `global ${entry.dir}`,
+        );
+      }
+
+      for (const entry of cases) {
+        const result = runForkSkill({
+          scriptPath,
+          cwd: workspace,
+          args: [entry.expected],
+          env: {
+            ...process.env,
+            XDG_CONFIG_HOME: xdgRoot,
+          },
+        });
+        assertSuccess(result);
+        expect(result.stdout).toContain(`Forked '${entry.expected}'`);
+        expect(
+          existsSync(join(workspace, `.brewva/skills/project/overlays/${entry.expected}/SKILL.md`)),
+        ).toBe(true);
+      }
+    } finally {
+      rmSync(workspace, { recursive: true, force: true });
+      rmSync(xdgRoot, { recursive: true, force: true });
+    }
+  });
+
   test("requires --force when destination already exists", () => {
     const workspace = mkdtempSync(join(tmpdir(), "brewva-skill-fork-force-"));
     const xdgRoot = mkdtempSync(join(tmpdir(), "brewva-skill-fork-force-xdg-"));